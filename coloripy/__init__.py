@@ -2,4 +2,4 @@ __author__ = 'Anowar J. Shajib'
 __email__ = 'ajshajib@gmail.com'
 __version__ = '0.0.0'
 
-from .coloripy import MshColorMap, get_msh_cmap, skew_scale
\ No newline at end of file
+from .coloripy import MshColorMap, get_msh_cmap, skew_scale, skew_scale_vec
\ No newline at end of file
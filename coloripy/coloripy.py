@@ -7,6 +7,9 @@ This library is inspired by and adopted from colorMapCreator.py by Carlo
 Bath.
 """
 
+import functools
+import math
+
 import numpy as np
 from matplotlib.colors import LinearSegmentedColormap
 
@@ -43,22 +46,29 @@ class MshColorMap(object):
                 [0.1804375, 0.0721750, 0.9503041],
             ]
         )
+        # Inverse transfer-matrix for the conversion of XYZ back to RGB
+        self._inverse_transfer_matrix = np.linalg.inv(self._transfer_matrix)
+
         if ref_point is None:
             self.xn, self.yn, self.zn = 95.047, 100.0, 108.883
         else:
             self.xn, self.yn, self.zn = ref_point
 
         assert (
-            np.mod(self.num_colors, 2) == 1
+            self.num_colors % 2 == 1
         ), "For diverging colormaps odd numbers of colors are desireable!"
 
-        known_methods = ["moreland", "lab"]
-        assert method in known_methods, "Unknown method was specified!"
+        generators = {
+            "moreland": self.generate_colormap,
+            "lab": self.generate_colormap_lab,
+        }
+        assert method in generators, "Unknown method was specified!"
 
-        if method == known_methods[0]:
-            self.color_map = self.generate_colormap(rgb1, rgb2, divide)
-        elif method == known_methods[1]:
-            self.color_map = self.generate_colormap_lab(rgb1, rgb2, divide)
+        # Msh of the end points, set by the Moreland-technique which is the
+        # only method that needs them
+        self._msh1, self._msh2 = None, None
+
+        self.color_map = generators[method](rgb1, rgb2, divide)
 
     def get_colormap(self):
         """
@@ -72,98 +82,117 @@ class MshColorMap(object):
         """
         Conversion from the sRGB components to RGB components with physically
         linear properties.
+        :param rgb: sRGB values in 0-255, array of shape (..., 3)
+        :return: linear RGB values in 0-100, same shape as `rgb`
         """
-
-        rgb_linear = np.zeros((3,))
-
-        for i, value in enumerate(rgb):
-            value = float(value) / 255.0
-            if value > 0.04045:
-                value = ((value + 0.055) / 1.055) ** 2.4
-            else:
-                value = value / 12.92
-            rgb_linear[i] = value * 100.0
-        return rgb_linear
+        value = np.asarray(rgb, dtype=np.float64) * (1.0 / 255.0)
+        return _srgb_to_linear(value) * 100.0
 
     @staticmethod
     def get_srgb(rgb_linear):
         """
         Back conversion from linear RGB to sRGB.
+        :param rgb_linear: linear RGB values in 0-100, array of shape (..., 3)
+        :return: sRGB values in 0-255, same shape as `rgb_linear`
         """
-
-        srgb = np.zeros((3,))
-
-        for i, value in enumerate(rgb_linear):
-            value = float(value) / 100.0
-
-            if value > 0.00313080495356037152:
-                value = (1.055 * np.power(value, 1.0 / 2.4)) - 0.055
-            else:
-                value = value * 12.92
-
-            srgb[i] = round(value * 255.0)
-
-        return srgb
+        value = np.asarray(rgb_linear, dtype=np.float64) * (1.0 / 100.0)
+        return np.round(_linear_to_srgb(value) * 255.0)
 
     def convert_rgb2xyz(self, rgb):
         """
-        Conversion of RGB to XYZ using the transfer-matrix
+        Conversion of RGB to XYZ using the transfer-matrix. Works on a single
+        color or on an array of shape (N, 3).
         """
-        return np.dot(self.linearize_rgb(rgb), self._transfer_matrix)
+        if np.ndim(rgb) > 1:
+            return self._rgb_block_to_xyz(rgb)
+        return np.array(self._rgb2xyz_floats(rgb))
 
     def convert_xyz2rgb(self, xyz):
         """
-        Conversion of RGB to XYZ using the transfer-matrix
+        Conversion of XYZ to RGB using the transfer-matrix. Works on a single
+        color or on an array of shape (N, 3).
         :param self:
         :param xyz:
         :return:
         """
-        # return np.round(np.dot(xyz,
-        #                   np.array(np.matrix(self._transfer_matrix).I)))
-        return self.get_srgb(np.dot(xyz, np.array(np.matrix(self._transfer_matrix).I)))
+        if np.ndim(xyz) > 1:
+            return self._xyz_block_to_rgb(xyz)
+        rgb_linear = _dot3(
+            np.asarray(xyz, dtype=float).tolist(), self._inverse_transfer_matrix
+        )
+        return np.array(
+            [
+                round(_linear_to_srgb(value * (1.0 / 100.0)) * 255.0)
+                for value in rgb_linear
+            ],
+            dtype=float,
+        )
+
+    def _rgb2xyz_floats(self, rgb):
+        """
+        Conversion of a single RGB color to XYZ on Python floats.
+        :param rgb: RGB values in 0-255, array of shape (3,)
+        :return: tuple of the X, Y and Z values
+        """
+        rgb_linear = [
+            _srgb_to_linear(value * (1.0 / 255.0)) * 100.0
+            for value in np.asarray(rgb, dtype=float).tolist()
+        ]
+        return _dot3(rgb_linear, self._transfer_matrix)
+
+    def _rgb_block_to_xyz(self, rgb_block):
+        """
+        Conversion of a block of RGB colors to XYZ.
+        :param rgb_block: RGB values in 0-255, array of shape (N, 3)
+        :return: XYZ values, array of shape (N, 3)
+        """
+        # np.matmul goes straight to the BLAS matrix product for large N; if
+        # this product is ever chained with another matrix, the two can be
+        # contracted in one go with opt_einsum.contract("ni,ij,jk->nk", ...)
+        return np.matmul(self.linearize_rgb(rgb_block), self._transfer_matrix)
+
+    def _xyz_block_to_rgb(self, xyz_block):
+        """
+        Conversion of a block of XYZ colors to RGB.
+        :param xyz_block: XYZ values, array of shape (N, 3)
+        :return: RGB values in 0-255, array of shape (N, 3)
+        """
+        return self.get_srgb(np.matmul(xyz_block, self._inverse_transfer_matrix))
 
     def convert_rgb2lab(self, rgb):
         """
         Conversion of RGB to CIELAB
         """
+        x, y, z = self._rgb2xyz_floats(rgb)
 
-        x, y, z = (self.convert_rgb2xyz(rgb)).tolist()
-
-        def helper_func(a):
-            limit = 0.008856
-            if a > limit:
-                return np.power(a, 1.0 / 3.0)
-            else:
-                return 7.787 * a + 16.0 / 116.0
+        fx = _lab_f(x / self.xn)
+        fy = _lab_f(y / self.yn)
+        fz = _lab_f(z / self.zn)
 
-        l = 116.0 * (helper_func(y / self.yn) - (16.0 / 116.0))
-        a = 500.0 * (helper_func(x / self.xn) - helper_func(y / self.yn))
-        b = 200.0 * (helper_func(y / self.yn) - helper_func(z / self.zn))
+        l = 116.0 * (fy - _LAB_OFFSET)
+        a = 500.0 * (fx - fy)
+        b = 200.0 * (fy - fz)
 
         return np.array([l, a, b])
 
-    def convert_lab2rgb(self, lab):
+    def convert_lab2xyz(self, lab):
         """
-        Conversion of CIELAB to RGB
+        Conversion of CIELAB to XYZ
         """
+        l, a, b = np.asarray(lab, dtype=float).tolist()
 
-        l, a, b = lab.tolist()
+        fy = (l + 16.0) / 116.0
+        x = self.xn * _lab_f_inverse(fy + a / 500.0)
+        y = self.yn * _lab_f_inverse(fy)
+        z = self.zn * _lab_f_inverse(fy - b / 200.0)
 
-        def finverse(x):
-            x_lim = 0.008856
-            a = 7.787
-            b = 16.0 / 116.0
-            y_lim = a * x_lim + b
-            if x > y_lim:
-                return np.power(x, 3)
-            else:
-                return (x - b) / a
+        return np.array([x, y, z])
 
-        x = self.xn * finverse((a / 500.0) + (l + 16.0) / 116.0)
-        y = self.yn * finverse((l + 16.0) / 116.0)
-        z = self.zn * finverse((l + 16.0) / 116.0 - (b / 200.0))
-
-        return self.convert_xyz2rgb(np.array([x, y, z]))
+    def convert_lab2rgb(self, lab):
+        """
+        Conversion of CIELAB to RGB
+        """
+        return self.convert_xyz2rgb(self.convert_lab2xyz(lab))
 
     @staticmethod
     def convert_lab2msh(lab):
@@ -173,9 +202,10 @@ class MshColorMap(object):
 
         l, a, b = lab.tolist()
 
-        m = np.sqrt(np.sum(np.power(lab, 2)))
-        s = np.arccos(l / m)
-        h = np.arctan2(b, a)
+        m = math.sqrt(l * l + a * a + b * b)
+        # pure black has no defined saturation, use 0 instead of NaN
+        s = math.acos(l / m) if m > 0 else 0.0
+        h = math.atan2(b, a)
         return np.array([m, s, h])
 
     @staticmethod
@@ -200,6 +230,51 @@ class MshColorMap(object):
         """Direct conversion of Msh to RGB."""
         return self.convert_lab2rgb(self.convert_msh2lab(msh))
 
+    def _rgb_block_to_lab(self, rgb_block):
+        """
+        Conversion of a block of RGB colors to CIELAB.
+        :param rgb_block: RGB values in 0-255, array of shape (N, 3)
+        :return: CIELAB values, array of shape (N, 3)
+        """
+        xyz = self._rgb_block_to_xyz(rgb_block)
+        f = _lab_f(xyz / np.array([self.xn, self.yn, self.zn]))
+
+        lab = np.empty_like(f)
+        lab[:, 0] = 116.0 * (f[:, 1] - _LAB_OFFSET)
+        lab[:, 1] = 500.0 * (f[:, 0] - f[:, 1])
+        lab[:, 2] = 200.0 * (f[:, 1] - f[:, 2])
+        return lab
+
+    def _lab_block_to_xyz(self, lab_block):
+        """
+        Conversion of a block of CIELAB colors to XYZ.
+        :param lab_block: CIELAB values, array of shape (N, 3)
+        :return: XYZ values, array of shape (N, 3)
+        """
+        f = np.empty_like(lab_block, dtype=float)
+        f[:, 1] = (lab_block[:, 0] + 16.0) / 116.0
+        f[:, 0] = f[:, 1] + lab_block[:, 1] / 500.0
+        f[:, 2] = f[:, 1] - lab_block[:, 2] / 200.0
+        return _lab_f_inverse(f) * np.array([self.xn, self.yn, self.zn])
+
+    def _rgb_block_to_msh(self, rgb_block):
+        """
+        Conversion of a block of RGB colors to Msh in one pass.
+        :param rgb_block: RGB values in 0-255, array of shape (N, 3)
+        :return: Msh values, array of shape (N, 3)
+        """
+        lab = self._rgb_block_to_lab(rgb_block)
+
+        msh = np.empty_like(lab)
+        msh[:, 0] = np.linalg.norm(lab, axis=1)
+        # pure black has no defined saturation, use 0 instead of NaN
+        nonzero = msh[:, 0] > 0
+        msh[:, 1] = np.arccos(
+            np.divide(lab[:, 0], msh[:, 0], out=np.ones(len(msh)), where=nonzero)
+        )
+        msh[:, 2] = np.arctan2(lab[:, 2], lab[:, 1])
+        return msh
+
     @staticmethod
     def adjust_hue(msh_saturated, m_unstaturated):
         """
@@ -222,30 +297,72 @@ class MshColorMap(object):
             else:
                 return h_saturated - h_spin
 
-    def interpolate_color(self, rgb1, rgb2, interp):
+    def interpolate_color(self, rgb1, rgb2, interp, msh1=None, msh2=None):
         """
         Interpolation algorithm to automatically create continuous diverging
         color maps.
+        :param rgb1:
+        :param rgb2:
+        :param interp: interpolation fraction between 0 and 1
+        :param msh1: Msh of rgb1, converted from rgb1 if not provided
+        :param msh2: Msh of rgb2, converted from rgb2 if not provided
         """
+        if msh1 is None or msh2 is None:
+            msh1, msh2 = self._rgb_block_to_msh(np.array([rgb1, rgb2]))
+        return self._msh_block_to_rgb(self._interpolate_vec(msh1, msh2, [interp]))[0]
+
+    def _interpolate_vec(self, msh1, msh2, interps):
+        """
+        Interpolate between two Msh colors for a whole array of interpolation
+        fractions, see `interpolate_color`.
+        :param msh1: Msh of the first end point
+        :param msh2: Msh of the second end point
+        :param interps: array of fractions between 0 and 1
+        :return: interpolated Msh values, array of shape (N, 3)
+        """
+        interps = np.asarray(interps, dtype=float)
+        segments = self._segment_end_points(msh1, msh2)
+
+        if len(segments) == 2:
+            msh_left = self._interpolate_segment(segments[0], 2 * interps)
+            msh_right = self._interpolate_segment(segments[1], 2 * interps - 1.0)
+            return np.where((interps < 0.5)[:, np.newaxis], msh_left, msh_right)
 
-        msh1 = self.convert_rgb2msh(rgb1)
+        return self._interpolate_segment(segments[0], interps)
+
+    def _segment_end_points(self, msh1, msh2):
+        """
+        Control points of the linear segments of the interpolation. They only
+        depend on the end points, so they are decided once per colormap.
+        :param msh1: Msh of the first end point
+        :param msh2: Msh of the second end point
+        :return: array of shape (num_segments, 2, 3) with the hue-adjusted
+            start and end Msh of each segment, num_segments is 2 if white is
+            placed in the middle and 1 otherwise
+        """
         m1, s1, h1 = msh1.tolist()
-        msh2 = self.convert_rgb2msh(rgb2)
         m2, s2, h2 = msh2.tolist()
 
         # If points saturated and distinct, place white in middle
         if (s1 > 0.05) and (s2 > 0.05) and (np.abs(h1 - h2) > np.pi / 3.0):
             Mmid = max([m1, m2, 88.0])
-            if interp < 0.5:
-                m2 = Mmid
-                s2 = 0.0
-                h2 = 0.0
-                interp = 2 * interp
-            else:
-                m1 = Mmid
-                s1 = 0.0
-                h1 = 0.0
-                interp = 2 * interp - 1.0
+            msh_white = np.array([Mmid, 0.0, 0.0])
+            return np.array(
+                [
+                    self._adjust_end_points(msh1, msh_white),
+                    self._adjust_end_points(msh_white, msh2),
+                ]
+            )
+
+        return np.array([self._adjust_end_points(msh1, msh2)])
+
+    def _adjust_end_points(self, msh1, msh2):
+        """
+        Adjust the hue of an unsaturated end point of a segment.
+        :return: array of shape (2, 3) with the adjusted end points
+        """
+        m1, s1, h1 = msh1.tolist()
+        m2, s2, h2 = msh2.tolist()
 
         # Adjust hue of unsaturated colors
         if (s1 < 0.05) and (s2 > 0.05):
@@ -253,27 +370,55 @@ class MshColorMap(object):
         elif (s2 < 0.05) and (s1 > 0.05):
             h2 = self.adjust_hue(np.array([m1, s1, h1]), m2)
 
-        # Linear interpolation on adjusted control points
-        msh_mid = (1 - interp) * np.array([m1, s1, h1]) + interp * np.array(
-            [m2, s2, h2]
-        )
+        return np.array([[m1, s1, h1], [m2, s2, h2]])
 
-        return self.convert_msh2rgb(msh_mid)
+    @staticmethod
+    def _interpolate_segment(segment, interps):
+        """
+        Linear interpolation in Msh space between the two control points of a
+        segment.
+        """
+        return np.outer(1 - interps, segment[0]) + np.outer(interps, segment[1])
+
+    def _msh_block_to_rgb(self, msh_block):
+        """
+        Conversion of a block of Msh colors to RGB in one pass.
+        :param msh_block: Msh values, array of shape (N, 3)
+        :return: RGB values in 0-255, array of shape (N, 3)
+        """
+        m, s, h = msh_block[:, 0], msh_block[:, 1], msh_block[:, 2]
+
+        lab = np.empty_like(msh_block)
+        lab[:, 0] = m * np.cos(s)
+        lab[:, 1] = m * np.sin(s) * np.cos(h)
+        lab[:, 2] = m * np.sin(s) * np.sin(h)
+        return self._lab_block_to_rgb(lab)
+
+    def _lab_block_to_rgb(self, lab_block):
+        """
+        Conversion of a block of CIELAB colors to RGB in one pass.
+        :param lab_block: CIELAB values, array of shape (N, 3)
+        :return: RGB values in 0-255, array of shape (N, 3)
+        """
+        return self._xyz_block_to_rgb(self._lab_block_to_xyz(lab_block))
 
-    def generate_colormap(self, rgb1, rgb2, divide):
+    def generate_colormap(self, rgb1, rgb2, divide, msh1=None, msh2=None):
         """
         Generate the complete diverging color map using the Moreland-technique
         from RGB1 to RGB2, placing "white" in the middle. The number of points
         given by "numPoints" controls the resolution of the colormap. The
         optional parameter "divide" gives the possibility to scale the whole
-        colormap, for example to have float values from 0 to 1.
+        colormap, for example to have float values from 0 to 1. The Msh of
+        the end points can be passed as "msh1" and "msh2" if already known.
         """
 
-        # calculate
+        if msh1 is None or msh2 is None:
+            msh1, msh2 = self._rgb_block_to_msh(np.array([rgb1, rgb2]))
+        # constant for the whole colormap, kept for later interpolations
+        self._msh1, self._msh2 = msh1, msh2
+
         scalars = np.linspace(0.0, 1.0, self.num_colors)
-        RGBs = np.zeros((self.num_colors, 3))
-        for i, s in enumerate(scalars):
-            RGBs[i, :] = self.interpolate_color(rgb1, rgb2, s)
+        RGBs = self._msh_block_to_rgb(self._interpolate_vec(msh1, msh2, scalars))
         return RGBs / divide
 
     def generate_colormap_lab(self, rgb1, rgb2, divide):
@@ -289,19 +434,91 @@ class MshColorMap(object):
         lab2 = self.convert_rgb2lab(rgb2)
         lab_white = np.array([100.0, 0.0, 0.0])
 
-        lab = np.zeros((int(self.num_colors), 3))
-        rgbs = np.zeros((int(self.num_colors), 3))
-        n2 = np.floor(self.num_colors / 2.0)
+        n2 = self.num_colors // 2
 
-        for i in range(3):
-            lab[0 : n2 + 1, i] = np.linspace(lab1[i], lab_white[i], n2 + 1)
-            lab[n2:, i] = np.linspace(lab_white[i], lab2[i], n2 + 1)
-        for i, l in enumerate(lab):
-            rgbs[i, :] = self.convert_lab2rgb(l)
+        lab = np.empty((self.num_colors, 3))
+        lab[: n2 + 1] = np.linspace(lab1, lab_white, n2 + 1)
+        lab[n2:] = np.linspace(lab_white, lab2, n2 + 1)
+        rgbs = self._lab_block_to_rgb(lab)
 
         return rgbs / divide
 
 
+def _srgb_to_linear(value):
+    """
+    Inverse sRGB companding of values in 0-1. Works on a single float or on
+    an array.
+    """
+    if isinstance(value, float):
+        if value > 0.04045:
+            return ((value + 0.055) / 1.055) ** 2.4
+        return value / 12.92
+    return np.where(value > 0.04045, ((value + 0.055) / 1.055) ** 2.4, value / 12.92)
+
+
+def _linear_to_srgb(value):
+    """
+    sRGB companding of linear values in 0-1. Works on a single float or on
+    an array.
+    """
+    if isinstance(value, float):
+        if value > 0.00313080495356037152:
+            return 1.055 * value ** (1.0 / 2.4) - 0.055
+        return value * 12.92
+    return np.where(
+        value > 0.00313080495356037152,
+        1.055 * np.power(np.abs(value), 1.0 / 2.4) - 0.055,
+        value * 12.92,
+    )
+
+
+# Constants of the CIELAB transfer function
+_LAB_EPSILON = 0.008856
+_LAB_KAPPA = 7.787
+_LAB_OFFSET = 16.0 / 116.0
+
+
+def _lab_f(t):
+    """
+    CIELAB transfer function, applied to XYZ normalized by the reference
+    white point. Works on a single float or on an array.
+    """
+    if isinstance(t, float):
+        if t > _LAB_EPSILON:
+            return t ** (1.0 / 3.0)
+        return _LAB_KAPPA * t + _LAB_OFFSET
+    return np.where(t > _LAB_EPSILON, np.cbrt(t), _LAB_KAPPA * t + _LAB_OFFSET)
+
+
+def _lab_f_inverse(f):
+    """
+    Inverse of `_lab_f`. Works on a single float or on an array.
+    """
+    f_lim = _LAB_KAPPA * _LAB_EPSILON + _LAB_OFFSET
+    if isinstance(f, float):
+        if f > f_lim:
+            return f * f * f
+        return (f - _LAB_OFFSET) / _LAB_KAPPA
+    return np.where(f > f_lim, f * f * f, (f - _LAB_OFFSET) / _LAB_KAPPA)
+
+
+def _dot3(vector, matrix):
+    """
+    Product of a single color with a 3x3 transfer-matrix, written out to
+    avoid the dispatch overhead of np.dot on 3-vectors.
+    :param vector: sequence of three floats
+    :param matrix: array of shape (3, 3)
+    :return: tuple of three floats, callers wrap it in an array if needed
+    """
+    x, y, z = vector
+    (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = matrix.tolist()
+    return (
+        x * m00 + y * m10 + z * m20,
+        x * m01 + y * m11 + z * m21,
+        x * m02 + y * m12 + z * m22,
+    )
+
+
 def skew_scale(fraction, mode="linear", power=1.0):
     """
     Rescale the color distribution to change emphasis.
@@ -310,6 +527,20 @@ def skew_scale(fraction, mode="linear", power=1.0):
     :param power:
     :return:
     """
+    return float(skew_scale_vec(fraction, mode, power))
+
+
+def skew_scale_vec(fracs, mode="linear", power=1.0):
+    """
+    Vectorized version of `skew_scale`, rescales an array of fractions at
+    once.
+    :param fracs: array-like of fractions between 0 and 1
+    :param mode:
+    :param power:
+    :return:
+    """
+    fracs = np.asarray(fracs, dtype=float)
+
     assert mode in [
         "linear",
         "square",
@@ -318,21 +549,18 @@ def skew_scale(fraction, mode="linear", power=1.0):
         "sqrt",
     ], "Rescaling mode not supported!"
 
-    if fraction >= 0.5:
-        sign = 1.0
-    else:
-        sign = -1.0
+    sign = np.where(fracs >= 0.5, 1.0, -1.0)
 
     if mode == "linear":
-        return fraction
+        return fracs
     elif mode == "square":
-        return (np.abs(fraction - 0.5) / 0.5) ** 2 * sign * 0.5 + 0.5
+        return np.power(np.abs(fracs - 0.5) / 0.5, 2) * sign * 0.5 + 0.5
     elif mode == "cubic":
-        return ((fraction - 0.5) / 0.5) ** 3 * 0.5 + 0.5
+        return np.power((fracs - 0.5) / 0.5, 3) * 0.5 + 0.5
     elif mode == "power":
-        return (np.abs(fraction - 0.5) / 0.5) ** power * sign * 0.5 + 0.5
+        return np.power(np.abs(fracs - 0.5) / 0.5, power) * sign * 0.5 + 0.5
     elif mode == "sqrt":
-        return np.sqrt(np.abs(fraction - 0.5) / 0.5) * sign * 0.5 + 0.5
+        return np.sqrt(np.abs(fracs - 0.5) / 0.5) * sign * 0.5 + 0.5
 
 
 def get_msh_cmap(
@@ -362,27 +590,46 @@ def get_msh_cmap(
     if ref_point is None:
         ref_point = [221, 221, 221]
 
+    color_dict = _build_color_dict(
+        tuple(np.ravel(rgb1).tolist()),
+        tuple(np.ravel(rgb2).tolist()),
+        tuple(np.ravel(ref_point).tolist()),
+        int(num_bins),
+        rescale,
+        float(power),
+        method,
+    )
+
+    # the cached segments are immutable tuples, only the dict is rebuilt
+    msh_cmap = LinearSegmentedColormap(
+        "msh", {color: list(entries) for color, entries in color_dict.items()}
+    )
+
+    return msh_cmap
+
+
+@functools.lru_cache(maxsize=64)
+def _build_color_dict(rgb1, rgb2, ref_point, num_bins, rescale, power, method):
+    """
+    Cached computation of the segment data for `get_msh_cmap`. All the
+    arguments have to be hashable.
+    :return: dictionary with a tuple of (fraction, value, value) entries for
+        each of the red, green and blue channels
+    """
     colormap = MshColorMap(
-        rgb1, rgb2, num_bins=num_bins, method=method, ref_point=ref_point
+        np.array(rgb1),
+        np.array(rgb2),
+        num_bins=num_bins,
+        method=method,
+        ref_point=ref_point,
     ).get_colormap()
 
-    color_dict = {"red": [], "green": [], "blue": []}
-
     n_bins = len(colormap)
+    fracs = skew_scale_vec(np.linspace(0.0, 1.0, n_bins), mode=rescale, power=power)
 
-    for i, rgb in enumerate(colormap):
-        red, green, blue = rgb
-        fraction = float(i) / (n_bins - 1)
-        color_dict["red"].append(
-            (skew_scale(fraction, mode=rescale, power=power), red, red)
-        )
-        color_dict["green"].append(
-            (skew_scale(fraction, mode=rescale, power=power), green, green)
-        )
-        color_dict["blue"].append(
-            (skew_scale(fraction, mode=rescale, power=power), blue, blue)
-        )
-
-    msh_cmap = LinearSegmentedColormap("msh", color_dict)
+    color_dict = {}
+    for i, color in enumerate(["red", "green", "blue"]):
+        entries = np.column_stack([fracs, colormap[:, i], colormap[:, i]])
+        color_dict[color] = tuple(map(tuple, entries.tolist()))
 
-    return msh_cmap
+    return color_dict
@@ -19,6 +19,15 @@ class TestColoripy(object):
         for mode, val in zip(modes, vals):
             assert isclose(cp.skew_scale(val, mode=mode), val)
 
+    def test_skew_scale_vec(self):
+        fracs = np.linspace(0., 1., 11)
+        for mode in ['linear', 'square', 'cubic', 'power', 'sqrt']:
+            scaled = cp.skew_scale_vec(fracs, mode=mode, power=1.5)
+            expected = [cp.skew_scale(f, mode=mode, power=1.5) for f in fracs]
+            assert np.allclose(scaled, expected)
+            assert np.allclose(cp.skew_scale_vec(fracs.tolist(), mode=mode,
+                                                 power=1.5), expected)
+
     def test_get_cmap(self):
         standard = np.array([[0.23137255, 0.29803922, 0.75294118],
                          [0.21960784, 0.41568627, 0.87058824],
@@ -50,6 +59,56 @@ class TestColoripy(object):
 
         assert isclose(np.sum(cmap-standard), 0., abs_tol=1e-8)
 
+    def test_get_msh_cmap_cached(self):
+        cp.coloripy._build_color_dict.cache_clear()
+        cmap1 = cp.get_msh_cmap(rgb1=np.array([59, 76, 192]),
+                                rescale='power', power=2.5)
+        cmap2 = cp.get_msh_cmap(rgb1=[59, 76, 192], rescale='power',
+                                power=2.5)
+
+        cache_info = cp.coloripy._build_color_dict.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 1
+        fracs = np.linspace(0., 1., 5)
+        assert np.allclose(cmap1(fracs), cmap2(fracs))
+
+    def test_get_cmap_lab(self):
+        rgb1 = np.array([59, 76, 192])
+        rgb2 = np.array([180, 4, 38])
+        cmap = cp.MshColorMap(rgb1, rgb2, num_bins=21, method='lab',
+                              divide=1.).get_colormap()
+
+        assert cmap.shape == (21, 3)
+        assert np.allclose(cmap[0], rgb1)
+        assert np.allclose(cmap[10], [255., 255., 255.])
+        assert np.allclose(cmap[-1], rgb2)
+
+    def test_black_end_point(self):
+        msh_cmap = cp.MshColorMap(np.array([0, 0, 0]), np.array([180, 4, 38]),
+                                  num_bins=5)
+
+        assert np.allclose(msh_cmap.convert_rgb2msh([0, 0, 0]), 0.)
+        assert np.allclose(msh_cmap.convert_lab2msh(np.zeros(3)), 0.)
+        assert np.all(np.isfinite(msh_cmap.get_colormap()))
+
+    def test_rgb2msh(self):
+        # reference values from the original per-component implementation
+        standard = np.array([[79.9787378384, 1.0804006445, -1.0985122447],
+                             [80.0810330582, 1.0803104396, 0.5025603704],
+                             [118.9941281006, 0.9366814, 2.3973169339],
+                             [91.518769774, 0.9299733201, -1.3119619141]])
+
+        msh_cmap = cp.MshColorMap(np.array([59, 76, 192]),
+                                  np.array([180, 4, 38]))
+        rgbs = np.array([[59, 76, 192], [180, 4, 38], [10, 200, 30],
+                         [0, 128, 255]])
+
+        assert np.allclose(msh_cmap._rgb_block_to_msh(rgbs), standard,
+                           rtol=0., atol=1e-8)
+        for rgb, msh in zip(rgbs, standard):
+            assert np.allclose(msh_cmap.convert_rgb2msh(rgb), msh,
+                               rtol=0., atol=1e-8)
+
     @classmethod
     def teardown_class(cls):
         pass